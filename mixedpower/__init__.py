@@ -1 +1 @@
-from .power import power, solve
\ No newline at end of file
+from .power import power, solve, solve_batch
\ No newline at end of file
@@ -1,12 +1,20 @@
 import numpy as np
 from typing import Union
-from scipy.stats import t as students_t # type: ignore
-from scipy.stats import nct # type: ignore
-from scipy.optimize import minimize # type: ignore
+from scipy.special import stdtrit, nctdtr, ndtr, ndtri # type: ignore
+from scipy.optimize import OptimizeResult # type: ignore
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 from mixedpower.constants import DESIGNS, VARIABLES
 
+# bound at import: the scalar/array dispatch in _nct_lower_tail runs twice
+# per power evaluation
+_ndarray = np.ndarray
+
+# beyond this |ncp| the far rejection tail carries < 1e-12 of the power
+_NCP_NEGLIGIBLE = -ndtri(1e-12)
+
 def power(
         design:str='CCC', 
         cohens_d:Union[int, np.float32]=0.5,
@@ -35,28 +43,32 @@ def power(
     participant_x_target : float
     target_slope : float
     participant_slope : float
-    n_participants : int
-    n_targets : int
+    n_participants : int or ndarray
+    n_targets : int or ndarray
     code : float 
     alpha : float
+
+    Any of the numeric arguments may be given as NumPy arrays, in which case
+    they are broadcast against each other and power is returned elementwise,
+    e.g. ``n_participants=np.arange(10, 500)`` gives a power curve in one call.
     """
     
-    assert design in DESIGNS, f"Design must be one of {DESIGNS}"
-
-    if design in ['CCC', 'CCC'.lower()]:
-        return power_ccc(
-            cohens_d=cohens_d,
-            resid=resid,
-            target_intercept=target_intercept,
-            participant_intercept=participant_intercept,
-            participant_x_target=participant_x_target,
-            target_slope=target_slope,
-            participant_slope=participant_slope,
-            n_participants=n_participants,
-            n_targets=n_targets,
-            code=code,
-            alpha=alpha
-        )
+    power_fn = _POWER_FNS.get(design)
+    assert power_fn is not None, f"Design must be one of {DESIGNS}"
+
+    return power_fn(
+        cohens_d=cohens_d,
+        resid=resid,
+        target_intercept=target_intercept,
+        participant_intercept=participant_intercept,
+        participant_x_target=participant_x_target,
+        target_slope=target_slope,
+        participant_slope=participant_slope,
+        n_participants=n_participants,
+        n_targets=n_targets,
+        code=code,
+        alpha=alpha
+    )
 
 def solve(variable:str='n_participants', **kwargs):
     """
@@ -68,12 +80,50 @@ def solve(variable:str='n_participants', **kwargs):
         The variable to solve for. Must be one of ['n_participants', 'n_targets'].
     """
 
-    assert variable in VARIABLES, f"Variable must be one of {VARIABLES}"
-    
-    if variable in ['n_participants', 'n_participants'.lower()]:
-        return solve_n_participants(**kwargs)
-    elif variable in ['n_targets', 'n_targets'.lower()]:
-        return solve_n_targets(**kwargs)
+    solve_fn = _SOLVE_FNS.get(variable)
+    assert solve_fn is not None, f"Variable must be one of {VARIABLES}"
+
+    return solve_fn(**kwargs)
+
+def solve_batch(param_grid, variable:str='n_participants', n_jobs:int=-1):
+    """
+    Solve for the same variable over many parameter sets in parallel.
+
+    Parameters
+    ----------
+    param_grid : iterable of dict
+        Keyword arguments for ``solve``, one dict per problem.
+    variable : str
+        The variable to solve for. Must be one of ['n_participants', 'n_targets'].
+    n_jobs : int
+        Number of worker processes. As in joblib, negative values count back
+        from the number of CPUs (-1 uses all of them, -2 all but one); 1
+        solves in this process. 0 is not allowed.
+
+    Returns a list of ``solve`` results in the order of ``param_grid``. With
+    ``n_jobs != 1``, call this from under ``if __name__ == "__main__":`` on
+    platforms that spawn worker processes (macOS, Windows).
+    """
+
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+
+    param_grid = list(param_grid)
+    if n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    if n_jobs == 1 or len(param_grid) <= 1:
+        return [solve(variable, **params) for params in param_grid]
+
+    # each solve takes well under a millisecond, so hand the workers large
+    # chunks to keep inter-process overhead from dominating
+    chunksize = max(1, math.ceil(len(param_grid) / (4 * n_jobs)))
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(
+            _solve_params, [variable] * len(param_grid), param_grid,
+            chunksize=chunksize))
+
+def _solve_params(variable:str, params:dict):
+    return solve(variable, **params)
 
 def power_ccc(
         cohens_d:Union[int, np.float32]=0.5,
@@ -89,36 +139,22 @@ def power_ccc(
         alpha:Union[int, np.float32]=0.05
         ):
     
-    # non-centrality parameter
-    ncp_denom = np.sqrt(2.0 * (resid/(n_participants*n_targets) + 
-                   2*code**2*target_slope/n_targets + 
-                   2*code**2*participant_x_target/n_participants))
-    ncp = cohens_d / ncp_denom
-
-    # DoF
-    MS_e  = resid
-    MS_sc = resid + n_participants * target_slope * code**2
-    MS_pc = resid + n_targets * participant_slope * code**2
-    dof_numer = (MS_pc + MS_sc - MS_e)**2
-    dof_denom = (MS_e**2 / ((n_participants-1)*(n_targets-1))) + (
-        MS_sc**2 / (n_targets-1)) + (MS_pc**2 / (n_participants-1))
-    df = dof_numer / dof_denom if dof_denom != 0 else 1.0  # avoid zero denom
-
-    alpha_half = alpha / 2.0
-
-    # cir values from the *central* t-distribution
-    t_crit_upper = students_t.ppf(1.0 - alpha_half, df) 
-    t_crit_lower = students_t.ppf(alpha_half,       df)
+    _check_variances(
+        resid, target_intercept, participant_intercept,
+        participant_x_target, target_slope, participant_slope)
 
-    cdf_upper = nct.cdf(t_crit_upper, df, ncp)
-    cdf_lower = nct.cdf(t_crit_lower, df, ncp)
+    p, ncp, df, t_crit_upper, sf_upper, cdf_lower = _power_ccc_terms(
+        cohens_d, resid, target_slope, participant_slope,
+        participant_x_target, n_participants, n_targets, code, alpha)
+    t_crit_lower = -t_crit_upper
+    cdf_upper = 1.0 - sf_upper
 
-    p = (1.0 - cdf_upper) + cdf_lower
-    v = np.sum([resid, participant_x_target,  
-                target_intercept, participant_intercept, 
-                ((code**2)*target_slope), 
-                ((code**2)*participant_slope)])
-    d_stdz = cohens_d / np.sqrt(v)
+    c2 = code*code
+    v = (resid + participant_x_target +
+         target_intercept + participant_intercept +
+         c2*target_slope +
+         c2*participant_slope)
+    d_stdz = cohens_d / v ** 0.5
 
     results = {
         'power': p,
@@ -134,6 +170,122 @@ def power_ccc(
 
     return p, results
 
+def _power_ccc_terms(
+        cohens_d, resid, target_slope, participant_slope,
+        participant_x_target, n_participants, n_targets, code, alpha
+        ):
+    """
+    Power of a CCC design with the intermediate terms it is built from,
+    ``(p, ncp, df, t_crit_upper, sf_upper, cdf_lower)``. The solvers call this
+    directly and skip the reporting-only quantities of ``power_ccc``.
+    """
+
+    ncp, df = _ncp_dof_ccc(
+        cohens_d, resid, target_slope, participant_slope,
+        participant_x_target, n_participants, n_targets, code)
+
+    # cir values from the *central* t-distribution (symmetric about 0); the
+    # lower quantile is taken directly so it stays accurate for tiny alpha
+    t_crit_upper = -stdtrit(df, 0.5*alpha)
+    t_crit_lower = -t_crit_upper
+
+    # the upper tail comes from 1 - F(t; df, ncp) = F(-t; df, -ncp), which
+    # avoids cancellation in 1 - cdf_upper when power is small
+    sf_upper = _nct_lower_tail(df, -ncp, t_crit_lower)
+    cdf_lower = _nct_lower_tail(df, ncp, t_crit_lower)
+
+    p = sf_upper + cdf_lower
+
+    return p, ncp, df, t_crit_upper, sf_upper, cdf_lower
+
+def _nct_lower_tail(df, ncp, t):
+    """
+    Non-central t CDF ``F(t; df, ncp)`` for ``t < 0``.
+
+    nctdtr is scipy's compiled (Boost) series for the non-central t, free of
+    the ``scipy.stats`` distribution machinery; a Python-level incomplete-beta
+    series (Lenth, 1987) would spend more time in the interpreter per term
+    than nctdtr takes for the whole sum.
+    """
+
+    # T < t < 0 requires Z + ncp < 0, so F(t) <= ndtr(-ncp); skip nctdtr
+    # once that bound is negligible, and clamp to it otherwise. Where nctdtr
+    # returns NaN (some large ncp or |t| at moderate df, where F(t) is tiny)
+    # fall back to 1 - F(-t; df, -ncp), and to the bound if that fails too
+    if not (isinstance(ncp, _ndarray) or isinstance(t, _ndarray)):
+        if ncp > _NCP_NEGLIGIBLE:
+            return 0.0
+        cdf = nctdtr(df, ncp, t)
+        if cdf != cdf:
+            cdf = 1.0 - nctdtr(df, -ncp, -t)
+        bound = ndtr(-ncp)
+        return cdf if cdf <= bound else bound
+
+    shape = np.broadcast(df, ncp, t).shape
+    cdf = nctdtr(
+        df, ncp, t, out=np.zeros(shape), where=ncp <= _NCP_NEGLIGIBLE)
+    failed = np.isnan(cdf)
+    if failed.any():
+        sf = nctdtr(df, -ncp, -t, out=np.ones(shape), where=failed)
+        cdf = np.where(failed, 1.0 - sf, cdf)
+    return np.fmin(cdf, ndtr(-ncp))
+
+def _ncp_dof_ccc(
+        cohens_d, resid, target_slope, participant_slope,
+        participant_x_target, n_participants, n_targets, code
+        ):
+    """
+    Non-centrality parameter and Welch-Satterthwaite degrees of freedom of
+    the condition effect in a CCC design.
+    """
+
+    c2 = code*code
+    npm1 = n_participants - 1
+    ntm1 = n_targets - 1
+
+    # non-centrality parameter
+    # ``** 0.5`` rather than np.sqrt: plain float arithmetic for scalars,
+    # still a ufunc sqrt for arrays
+    ncp_denom = (2.0 * (resid/(n_participants*n_targets) + 
+                   2*c2*target_slope/n_targets + 
+                   2*c2*participant_x_target/n_participants)) ** 0.5
+    ncp = cohens_d / ncp_denom
+
+    # DoF
+    MS_e  = resid
+    MS_sc = resid + n_participants * target_slope * c2
+    MS_pc = resid + n_targets * participant_slope * c2
+    dof_numer = (MS_pc + MS_sc - MS_e)**2
+    dof_denom = (MS_e**2 / (npm1*ntm1)) + (
+        MS_sc**2 / ntm1) + (MS_pc**2 / npm1)
+    # _check_variances requires resid > 0, so dof_denom > 0 for n >= 2
+    df = dof_numer / dof_denom
+
+    return ncp, df
+
+def _check_variances(
+        resid, target_intercept, participant_intercept,
+        participant_x_target, target_slope, participant_slope
+        ):
+    """
+    Reject variance components for which the CCC power is undefined.
+    """
+
+    # a zero residual variance can leave both the standard error of the
+    # effect and the Welch-Satterthwaite denominator at zero
+    invalid = resid <= 0
+    if invalid.any() if isinstance(invalid, np.ndarray) else invalid:
+        raise ValueError("resid must be positive")
+    for name, value in [
+            ('target_intercept', target_intercept),
+            ('participant_intercept', participant_intercept),
+            ('participant_x_target', participant_x_target),
+            ('target_slope', target_slope),
+            ('participant_slope', participant_slope)]:
+        invalid = value < 0
+        if invalid.any() if isinstance(invalid, np.ndarray) else invalid:
+            raise ValueError(f"{name} must be non-negative")
+
 def solve_n_participants(
         p:Union[int, np.float32]=0.8,
         cohens_d:Union[int, np.float32]=0.5,
@@ -148,33 +300,27 @@ def solve_n_participants(
         alpha:Union[int, np.float32]=0.05
 ):
     
-    def cost(p_candidate: float) -> float:
-            current_power, _ = power_ccc(
-                cohens_d=cohens_d,
-                resid=resid,
-                target_intercept=target_intercept,
-                participant_intercept=participant_intercept,
-                participant_x_target=participant_x_target,
-                target_slope=target_slope,
-                participant_slope=participant_slope,
-                n_participants=p_candidate,
-                n_targets=n_targets,
-                code=code,
-                alpha=alpha
-            )
-            return (current_power - p)**2
-    bounds = [(2.0, None)]
-    result = minimize(
-        cost,
-        x0=[1],
-        method='L-BFGS-B',
-        bounds=bounds
-    )
+    _check_variances(
+        resid, target_intercept, participant_intercept,
+        participant_x_target, target_slope, participant_slope)
+
+    def residual(p_candidate: float) -> float:
+            current_power = _power_ccc_terms(
+                cohens_d, resid, target_slope, participant_slope,
+                participant_x_target, p_candidate, n_targets, code, alpha)[0]
+            return current_power - p
 
-    if not dict(result)['success']:
-        return None, result
+    # large-sample (normal) approximation of the root, used as a warm start
+    # unless it never reaches p (e.g. cohens_d == 0 or p == 1)
+    c2 = code*code
+    z2 = (ndtri(1.0 - alpha/2.0) + ndtri(p))**2
+    n_start = 2.0
+    if 0 < z2 < math.inf:
+        den = cohens_d**2/(2*z2) - 2*c2*target_slope/n_targets
+        if den > 0:
+            n_start = (resid/n_targets + 2*c2*participant_x_target) / den
 
-    return math.ceil(float(dict(result)['x'][0])), result
+    return _solve_monotone(residual, n_start=n_start)
 
 def solve_n_targets(
         p:Union[int, np.float32]=0.8,
@@ -190,30 +336,110 @@ def solve_n_targets(
         alpha:Union[int, np.float32]=0.05
 ):
     
-    def cost(t_candidate: float) -> float:
-            current_power, _ = power_ccc(
-                cohens_d=cohens_d,
-                resid=resid,
-                target_intercept=target_intercept,
-                participant_intercept=participant_intercept,
-                participant_x_target=participant_x_target,
-                target_slope=target_slope,
-                participant_slope=participant_slope,
-                n_participants=n_participants,
-                n_targets=t_candidate,
-                code=code,
-                alpha=alpha
-            )
-            return (current_power - p)**2
-    bounds = [(2.0, None)]
-    result = minimize(
-        cost,
-        x0=[1],
-        method='L-BFGS-B',
-        bounds=bounds
-    )
+    _check_variances(
+        resid, target_intercept, participant_intercept,
+        participant_x_target, target_slope, participant_slope)
+
+    def residual(t_candidate: float) -> float:
+            current_power = _power_ccc_terms(
+                cohens_d, resid, target_slope, participant_slope,
+                participant_x_target, n_participants, t_candidate, code, alpha)[0]
+            return current_power - p
+
+    # large-sample (normal) approximation of the root, used as a warm start
+    # unless it never reaches p (e.g. cohens_d == 0 or p == 1)
+    c2 = code*code
+    z2 = (ndtri(1.0 - alpha/2.0) + ndtri(p))**2
+    n_start = 2.0
+    if 0 < z2 < math.inf:
+        den = cohens_d**2/(2*z2) - 2*c2*participant_x_target/n_participants
+        if den > 0:
+            n_start = (resid/n_participants + 2*c2*target_slope) / den
+
+    return _solve_monotone(residual, n_start=n_start)
+
+def _solve_monotone(
+        residual, n_start:float=2.0, n_min:float=2.0, n_max:float=2.0**24
+        ):
+    """
+    Find the sample size at which ``residual`` (power minus desired power),
+    which increases with sample size, crosses zero.
+
+    The root is bracketed by halving or doubling from the initial guess
+    ``n_start`` and then narrowed with safeguarded secant steps on the
+    integer grid, since only the smallest sufficient integer ``n`` is needed.
+    This typically costs four or five scalar power evaluations; tabulating
+    power over a grid of ``n`` in one broadcast call is slower, as nctdtr
+    costs about as much per array element as per scalar call.
+    Returns ``(n, result)``; ``n`` is ``None`` if the desired power is not
+    reached below ``n_max``.
+    """
+
+    # the bracketing loops re-test their end points
+    cache = {}
+    def cached_residual(n: float) -> float:
+        n = float(n)
+        if n not in cache:
+            cache[n] = residual(n)
+        return cache[n]
+
+    # clamp the guess into the search range
+    if not n_min < n_start < n_max:
+        n_start = n_max if n_start >= n_max else n_min
+
+    lo = hi = float(n_start)
+    if cached_residual(lo) >= 0:
+        while cached_residual(lo) >= 0:
+            if lo <= n_min:
+                return math.ceil(lo), OptimizeResult(
+                    x=np.array([lo]), fun=cache[lo], success=True,
+                    nfev=len(cache), nit=0,
+                    message='Desired power reached at the lower bound.')
+            hi, lo = lo, max(n_min, lo / 2.0)
+    else:
+        # ``not >= 0`` so that a NaN power counts as falling short
+        while not cached_residual(hi) >= 0:
+            if hi >= n_max:
+                return None, OptimizeResult(
+                    x=np.array([hi]), fun=cache[hi], success=False,
+                    nfev=len(cache), nit=0,
+                    message=f'Desired power not reached for n <= {n_max:g}.')
+            lo, hi = hi, 2.0 * hi
+
+    # largest integer known to fall short and smallest known to suffice
+    n_lo, n_hi = math.floor(lo), math.ceil(hi)
+    # secant through the two most recent evaluations, which stay close to the
+    # root instead of anchoring on a stale bracket end as regula falsi does
+    x1, f1, x2, f2 = lo, cache[lo], hi, cache[hi]
+    nit = slow = 0
+    while n_hi - n_lo > 1:
+        nit += 1
+        width = n_hi - n_lo
+        x = x2 - f2 * (x2 - x1) / (f2 - f1) if f2 != f1 else math.nan
+        if slow >= 2 or not n_lo < x < n_hi:
+            # the secant has stopped halving the bracket (e.g. power saturates
+            # at exactly p, so f2 == f1 == 0): bisect to keep the search
+            # O(log n)
+            x = 0.5 * (n_lo + n_hi)
+        n = min(max(math.ceil(x), n_lo + 1), n_hi - 1)
+        f = cached_residual(n)
+        if f >= 0:
+            n_hi = n
+        else:
+            n_lo = n
+        x1, f1, x2, f2 = x2, f2, n, f
+        slow = slow + 1 if 2 * (n_hi - n_lo) > width else 0
+
+    result = OptimizeResult(
+        x=np.array([float(n_hi)]), fun=cached_residual(n_hi), success=True,
+        nfev=len(cache), nit=nit,
+        message='Smallest sample size reaching the desired power found.')
 
-    if not dict(result)['success']:
-        return None, result
+    return n_hi, result
 
-    return math.ceil(float(dict(result)['x'][0])), result
\ No newline at end of file
+# dispatch tables for power() and solve(), built once at import
+_POWER_FNS = {'CCC': power_ccc, 'ccc': power_ccc}
+_SOLVE_FNS = {
+    'n_participants': solve_n_participants,
+    'n_targets': solve_n_targets,
+}
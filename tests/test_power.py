@@ -0,0 +1,126 @@
+import itertools
+
+import numpy as np
+import pytest
+from scipy.stats import nct
+from scipy.stats import t as students_t
+
+import mixedpower as mp
+from mixedpower.power import power_ccc, solve_n_participants, solve_n_targets
+
+GRID = list(itertools.product(
+    [0.2, 0.5, 1.5],        # cohens_d
+    [0.3, 1.0],             # resid
+    [0.0, 0.05, 0.2],       # target_slope
+    [0.05, 0.2],            # participant_x_target
+    [2, 5, 30],             # n_participants
+    [5, 100],               # n_targets
+    [0.05, 0.001],          # alpha
+))
+
+
+def reference_power(cohens_d, resid, target_slope, participant_x_target,
+                    n_participants, n_targets, alpha,
+                    participant_slope=0.05, code=1.0):
+    """Baseline formulation: scipy.stats quantiles and 1 - cdf tails."""
+    ncp = cohens_d / np.sqrt(2.0 * (
+        resid/(n_participants*n_targets) +
+        2*code**2*target_slope/n_targets +
+        2*code**2*participant_x_target/n_participants))
+    MS_sc = resid + n_participants * target_slope * code**2
+    MS_pc = resid + n_targets * participant_slope * code**2
+    df = (MS_pc + MS_sc - resid)**2 / (
+        resid**2/((n_participants-1)*(n_targets-1)) +
+        MS_sc**2/(n_targets-1) + MS_pc**2/(n_participants-1))
+    t_crit = students_t.ppf(1.0 - alpha/2.0, df)
+    return nct.sf(t_crit, df, ncp) + nct.cdf(-t_crit, df, ncp)
+
+
+@pytest.mark.parametrize(
+    'cohens_d,resid,target_slope,participant_x_target,'
+    'n_participants,n_targets,alpha', GRID)
+def test_power_matches_scipy_stats(cohens_d, resid, target_slope,
+                                   participant_x_target, n_participants,
+                                   n_targets, alpha):
+    expected = reference_power(cohens_d, resid, target_slope,
+                               participant_x_target, n_participants,
+                               n_targets, alpha)
+    p, _ = power_ccc(cohens_d=cohens_d, resid=resid, target_slope=target_slope,
+                     participant_x_target=participant_x_target,
+                     n_participants=n_participants, n_targets=n_targets,
+                     alpha=alpha)
+    assert np.isfinite(p)
+    if np.isfinite(expected):
+        assert p == pytest.approx(expected, rel=1e-8, abs=1e-12)
+
+
+def test_power_broadcasts_like_scalar_calls():
+    n = np.arange(2, 40)
+    p, _ = mp.power(n_participants=n, cohens_d=0.4)
+    expected = [mp.power(n_participants=int(k), cohens_d=0.4)[0] for k in n]
+    np.testing.assert_allclose(p, expected, rtol=1e-13)
+
+
+def test_power_finite_where_nctdtr_returns_nan():
+    # nctdtr gives NaN for the lower tail here (ncp ~ 6.99, df ~ 4.33)
+    p, results = mp.power(cohens_d=1.5, n_participants=5, alpha=0.01)
+    assert np.isfinite(results['cdf_lower'])
+    assert p == pytest.approx(0.94309, abs=1e-5)
+
+
+def brute_force_n(power_at, p, n_max=5000):
+    n = np.arange(2, n_max)
+    reached = np.flatnonzero(power_at(n) >= p)
+    return int(n[reached[0]]) if reached.size else None
+
+
+@pytest.mark.parametrize('cohens_d,p,n_other', list(itertools.product(
+    [0.3, 0.5, 1.5], [0.5, 0.8, 0.95], [10, 40, 200])))
+def test_solve_finds_smallest_sufficient_n(cohens_d, p, n_other):
+    kwargs = dict(cohens_d=cohens_d, alpha=0.01)
+
+    n, result = solve_n_participants(p=p, n_targets=n_other, **kwargs)
+    expected = brute_force_n(
+        lambda k: power_ccc(n_participants=k, n_targets=n_other, **kwargs)[0],
+        p)
+    assert n == expected
+    if n is not None:
+        assert result.success and result.fun >= 0
+
+    n, _ = solve_n_targets(p=p, n_participants=n_other, **kwargs)
+    expected = brute_force_n(
+        lambda k: power_ccc(n_participants=n_other, n_targets=k, **kwargs)[0],
+        p)
+    assert n == expected
+
+
+def test_solve_around_nctdtr_nan():
+    n, _ = mp.solve(p=0.8, cohens_d=1.5, alpha=0.01)
+    assert n == 5
+
+
+def test_solve_saturated_power_is_logarithmic():
+    # power reaches exactly 1.0 in floating point, so the residual is 0 over
+    # a long stretch of n above the answer
+    n, result = mp.solve(p=1.0)
+    assert mp.power(n_participants=n)[0] >= 1.0
+    assert mp.power(n_participants=n - 1)[0] < 1.0
+    assert result.nfev < 40
+
+
+def test_solve_unreachable_power():
+    n, result = mp.solve(cohens_d=0.0, target_slope=0.0)
+    assert n is None
+    assert not result.success
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(resid=0.0),
+    dict(target_slope=-0.1),
+    dict(resid=np.array([1.0, 0.0])),
+])
+def test_invalid_variances_raise(kwargs):
+    with pytest.raises(ValueError):
+        mp.power(**kwargs)
+    with pytest.raises(ValueError):
+        mp.solve(**kwargs)